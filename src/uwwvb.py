@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: GPL-3.0-only
 
-# ruff: noqa: C405 PYI024 PLR2004 FBT001 FBT002
+# ruff: noqa: C405 PYI024 PLR2004 FBT001 FBT002 TC003
 
 """Implementation of a WWVB state machine & decoder for resource-constrained systems"""
 
@@ -12,6 +12,10 @@ from collections import namedtuple
 
 import adafruit_datetime as datetime
 
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 ZERO, ONE, MARK = range(3)
 
 always_mark = set((0, 9, 19, 29, 39, 49, 59))
@@ -71,18 +75,15 @@ class WWVBDecoder:
         return f"<WWVBDecoder {self.state} {self.minute}>"
 
 
-def get_am_bcd(seq: list[int], *poslist: int) -> int | None:
+def get_am_bcd(seq: Sequence[int], *poslist: int) -> int | None:
     """Convert the bits seq[positions[0]], ... seq[positions[len(positions-1)]] [in MSB order] from BCD to decimal"""
-    pos = list(poslist)[::-1]
-    val = [int(seq[p]) for p in pos]
-    while len(val) % 4 != 0:
-        val.append(0)
     result = 0
     base = 1
-    for i in range(0, len(val), 4):
+    # Digits are taken 4 bits at a time starting from the least significant end
+    for i in range(len(poslist), 0, -4):
         digit = 0
-        for j in range(4):
-            digit += 1 << j if val[i + j] else 0
+        for p in poslist[max(0, i - 4) : i]:
+            digit = digit * 2 + (seq[p] != 0)
         if digit > 9:
             return None
         result += digit * base
@@ -91,9 +92,12 @@ def get_am_bcd(seq: list[int], *poslist: int) -> int | None:
 
 
 def decode_wwvb(
-    t: list[int] | None,
+    t: Sequence[int] | None,
 ) -> WWVBMinute | None:
-    """Convert a received minute of wwvb symbols to a WWVBMinute.  Returns None if any error is detected."""
+    """Convert a received minute of wwvb symbols to a WWVBMinute.  Returns None if any error is detected.
+
+    Any indexable sequence of symbols is accepted, such as a list or a bytearray.
+    """
     if not t:
         return None
     if not all(t[i] == MARK for i in always_mark):
@@ -7,17 +7,18 @@
 
 from __future__ import annotations
 
+import array
 import datetime
 import enum
-import json
+import functools
 import warnings
-from typing import TYPE_CHECKING, Any, NamedTuple, TextIO, TypeVar
+from typing import TYPE_CHECKING, NamedTuple, TextIO, TypeVar
 
 from . import iersdata
 from .tz import Mountain
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator, Iterable
 
 HOUR = datetime.timedelta(seconds=3600)
 SECOND = datetime.timedelta(seconds=1)
@@ -49,7 +50,6 @@ def _maybe_warn_update(dt: datetime.date, stacklevel: int = 1) -> None:
     # If the date is less than 300 days after today, there should be (possibly)
     # prospective available now.
     today = datetime.datetime.now(tz=datetime.timezone.utc).date()
-    print(f"_mwu {today=!r} {dt=!r} {iersdata.end=!r}")
     if _date(dt) < today + datetime.timedelta(days=330):
         warnings.warn(
             "Note: Running `updateiers` may provide better DUT1 and LS information",
@@ -57,19 +57,22 @@ def _maybe_warn_update(dt: datetime.date, stacklevel: int = 1) -> None:
         )
 
 
-def get_dut1(dt: datetime.date, *, warn_outdated: bool = True) -> float:
-    """Return the DUT1 number for the given timestamp"""
-    date = _date(dt)
-    i = (date - iersdata.DUT1_DATA_START).days
+def _get_dut1_tenths(dt: datetime.date, *, warn_outdated: bool = True, stacklevel: int = 1) -> int:
+    """Return the DUT1 number for the given timestamp, in units of 100ms"""
+    offsets = iersdata.DUT1_OFFSETS_INT8
+    i = dt.toordinal() - iersdata.DUT1_DATA_START_ORDINAL
     if i < 0:
-        v = iersdata.DUT1_OFFSETS[0]
-    elif i >= len(iersdata.DUT1_OFFSETS):
+        return offsets[0]
+    if i >= len(offsets):
         if warn_outdated:
-            _maybe_warn_update(dt, stacklevel=2)
-        v = iersdata.DUT1_OFFSETS[-1]
-    else:
-        v = iersdata.DUT1_OFFSETS[i]
-    return (ord(v) - ord("k")) / 10.0
+            _maybe_warn_update(dt, stacklevel=stacklevel + 1)
+        return offsets[-1]
+    return offsets[i]
+
+
+def get_dut1(dt: datetime.date, *, warn_outdated: bool = True) -> float:
+    """Return the DUT1 number for the given timestamp"""
+    return _get_dut1_tenths(dt, warn_outdated=warn_outdated, stacklevel=2) / 10.0
 
 
 def isly(year: int) -> bool:
@@ -82,10 +85,8 @@ def isly(year: int) -> bool:
 def isls(t: datetime.date) -> bool:
     """Return True if a leap second occurs at the end of this month"""
     dut1_today = get_dut1(t)
-    month_today = t.month
-    while t.month == month_today:
-        t += datetime.timedelta(1)
-    dut1_next_month = get_dut1(t)
+    next_month = datetime.date(t.year + (t.month == 12), t.month % 12 + 1, 1)
+    dut1_next_month = get_dut1(next_month)
     return dut1_today * dut1_next_month < 0
 
 
@@ -285,25 +286,45 @@ SYNC_T = 0x768
 SYNC_M = 0x1A3A
 
 
-def _extract_bit(v: int, p: int) -> bool:
-    """Extract bit 'p' from integer 'v' as a bool"""
-    return bool((v >> p) & 1)
-
-
 def _hamming_parity(value: int) -> int:
     """Compute the "hamming parity" of a 26-bit number, such as the minute-of-century
 
     For more details, see Enhanced WWVB Broadcast Format 4.3
     """
     parity = 0
-    for i in range(4, -1, -1):
-        bit = 0
-        for j in range(15):
-            bit ^= _extract_bit(value, _hamming_weight[i][j])
-        parity = (parity << 1) | bit
+    for mask in _hamming_masks:
+        parity = (parity << 1) | (bin(value & mask).count("1") & 1)
     return parity
 
 
+# Each parity bit covers the minute-of-century bits listed in its row of
+# _hamming_weight; as masks, computing a parity bit is a single popcount.
+# The most significant parity bit comes from the last row.
+_hamming_masks = [sum(1 << w for w in row) for row in reversed(_hamming_weight)]
+
+
+# Sources for the bits of a regular phase modulation minute, in transmission
+# order: an index into the field values computed by
+# WWVBMinute._fill_pm_timecode_regular, and the bit of that value to send
+_PM_SYNC_T, _PM_PARITY, _PM_MOC, _PM_DST_LS, _PM_DST_NEXT, _PM_FIXED = range(6)
+_PM_FIXED_BITS = 0b10  # The reserved and notice bits: 0 in bit 0, 1 in bit 1
+_pm_regular_layout = (
+    *((_PM_SYNC_T, b) for b in range(12, -1, -1)),  # 0-12
+    *((_PM_PARITY, b) for b in range(4, -1, -1)),  # 13-17
+    (_PM_MOC, 25),  # 18
+    (_PM_MOC, 0),  # 19
+    *((_PM_MOC, b) for b in range(24, 15, -1)),  # 20-28
+    (_PM_FIXED, 0),  # 29, reserved
+    *((_PM_MOC, b) for b in range(15, 6, -1)),  # 30-38
+    (_PM_FIXED, 1),  # 39, reserved
+    *((_PM_MOC, b) for b in range(6, -1, -1)),  # 40-46
+    (_PM_DST_LS, 4),  # 47
+    (_PM_DST_LS, 3),  # 48
+    (_PM_FIXED, 1),  # 49, notice
+    *((_PM_DST_LS, b) for b in range(2, -1, -1)),  # 50-52
+    *((_PM_DST_NEXT, b) for b in range(5, -1, -1)),  # 53-58
+)
+
 _dst_ls_lut = [
     0b01000,
     0b10101,
@@ -518,12 +539,13 @@ class WWVBMinute(_WWVBMinute):
         t._put_am_bcd(self.hour, 12, 13, 15, 16, 17, 18)
         t._put_am_bcd(self.days, 22, 23, 25, 26, 27, 28, 30, 31, 32, 33)
         ut1_sign = self.ut1 >= 0
-        t.am[36] = t.am[38] = AmplitudeModulation(ut1_sign)
-        t.am[37] = AmplitudeModulation(not ut1_sign)
+        # The channels hold plain ints, so bools can be stored directly as ZERO/ONE
+        t.am[36] = t.am[38] = ut1_sign
+        t.am[37] = not ut1_sign
         t._put_am_bcd(abs(self.ut1) // 100, 40, 41, 42, 43)
         t._put_am_bcd(self.year, 45, 46, 47, 48, 50, 51, 52, 53)  # Implicitly discards all but lowest 2 digits of year
-        t.am[55] = AmplitudeModulation(self.ly)
-        t.am[56] = AmplitudeModulation(self.ls)
+        t.am[55] = self.ly
+        t.am[56] = self.ls
         t._put_am_bcd(self.dst, 57, 58)
 
     def _fill_pm_timecode_extended(self, t: WWVBTimecode) -> None:
@@ -557,64 +579,21 @@ class WWVBMinute(_WWVBMinute):
         assert len(full_seq) == 360
 
         offset = minno * 60
-        for i in range(60):
-            t._put_pm_bit(i, full_seq[i + offset])
+        t.phase[:60] = array.array("b", full_seq[offset : offset + 60])
 
-    def _fill_pm_timecode_regular(self, t: WWVBTimecode) -> None:  # noqa: PLR0915
+    def _fill_pm_timecode_regular(self, t: WWVBTimecode) -> None:
         """Except during minutes 10..15 and 40..45, the amplitude signal holds 'regular information'"""
-        t._put_pm_bin(0, 13, SYNC_T)
-
         moc = self.minute_of_century
         _leap_sec = self._leap_sec
         dst_on = self.dst
         dst_ls = _dst_ls_lut[dst_on | (_leap_sec << 2)]
         dst_next = _get_dst_next(self.as_datetime())
-        t._put_pm_bin(13, 5, _hamming_parity(moc))
-        t._put_pm_bit(18, _extract_bit(moc, 25))
-        t._put_pm_bit(19, _extract_bit(moc, 0))
-        t._put_pm_bit(20, _extract_bit(moc, 24))
-        t._put_pm_bit(21, _extract_bit(moc, 23))
-        t._put_pm_bit(22, _extract_bit(moc, 22))
-        t._put_pm_bit(23, _extract_bit(moc, 21))
-        t._put_pm_bit(24, _extract_bit(moc, 20))
-        t._put_pm_bit(25, _extract_bit(moc, 19))
-        t._put_pm_bit(26, _extract_bit(moc, 18))
-        t._put_pm_bit(27, _extract_bit(moc, 17))
-        t._put_pm_bit(28, _extract_bit(moc, 16))
-        t._put_pm_bit(29, False)  # noqa: FBT003 # Reserved
-        t._put_pm_bit(30, _extract_bit(moc, 15))
-        t._put_pm_bit(31, _extract_bit(moc, 14))
-        t._put_pm_bit(32, _extract_bit(moc, 13))
-        t._put_pm_bit(33, _extract_bit(moc, 12))
-        t._put_pm_bit(34, _extract_bit(moc, 11))
-        t._put_pm_bit(35, _extract_bit(moc, 10))
-        t._put_pm_bit(36, _extract_bit(moc, 9))
-        t._put_pm_bit(37, _extract_bit(moc, 8))
-        t._put_pm_bit(38, _extract_bit(moc, 7))
-        t._put_pm_bit(39, True)  # noqa: FBT003 # Reserved
-        t._put_pm_bit(40, _extract_bit(moc, 6))
-        t._put_pm_bit(41, _extract_bit(moc, 5))
-        t._put_pm_bit(42, _extract_bit(moc, 4))
-        t._put_pm_bit(43, _extract_bit(moc, 3))
-        t._put_pm_bit(44, _extract_bit(moc, 2))
-        t._put_pm_bit(45, _extract_bit(moc, 1))
-        t._put_pm_bit(46, _extract_bit(moc, 0))
-        t._put_pm_bit(47, _extract_bit(dst_ls, 4))
-        t._put_pm_bit(48, _extract_bit(dst_ls, 3))
-        t._put_pm_bit(49, True)  # noqa: FBT003 # Notice
-        t._put_pm_bit(50, _extract_bit(dst_ls, 2))
-        t._put_pm_bit(51, _extract_bit(dst_ls, 1))
-        t._put_pm_bit(52, _extract_bit(dst_ls, 0))
-        t._put_pm_bit(53, _extract_bit(dst_next, 5))
-        t._put_pm_bit(54, _extract_bit(dst_next, 4))
-        t._put_pm_bit(55, _extract_bit(dst_next, 3))
-        t._put_pm_bit(56, _extract_bit(dst_next, 2))
-        t._put_pm_bit(57, _extract_bit(dst_next, 1))
-        t._put_pm_bit(58, _extract_bit(dst_next, 0))
+        fields = (SYNC_T, _hamming_parity(moc), moc, dst_ls, dst_next, _PM_FIXED_BITS)
+        t.phase[:59] = array.array("b", [(fields[f] >> b) & 1 for f, b in _pm_regular_layout])
         if len(t.phase) > 59:
-            t._put_pm_bit(59, PhaseModulation.ZERO)
+            t.phase[59] = PhaseModulation.ZERO
         if len(t.phase) > 60:
-            t._put_pm_bit(60, PhaseModulation.ZERO)
+            t.phase[60] = PhaseModulation.ZERO
 
     def _fill_pm_timecode(self, t: WWVBTimecode) -> None:
         """Fill the phase portion of a timecode object"""
@@ -676,7 +655,27 @@ class WWVBMinute(_WWVBMinute):
         newls: bool | None = None,
         old_time: WWVBMinute | None = None,
     ) -> WWVBMinute:
-        """Construct a WWVBMinute from a datetime, possibly specifying ut1/ls data or propagating it from an old time"""
+        """Construct a WWVBMinute from a datetime, possibly specifying ut1/ls data or propagating it from an old time
+
+        WWVBMinute values are immutable, so results are cached: asking for the
+        same minute again skips the DST and DUT1 lookups.
+        """
+        # Aware datetimes that differ only in fold compare and hash equal, so
+        # they are normalized to UTC before being used as a cache key
+        if d.utcoffset() is not None:
+            d = d.astimezone(datetime.timezone.utc)
+        return cls._from_datetime_cached(d, newut1, newls, old_time)
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _from_datetime_cached(
+        cls,
+        d: datetime.datetime,
+        newut1: int | None,
+        newls: bool | None,
+        old_time: WWVBMinute | None,
+    ) -> WWVBMinute:
+        """Construct a WWVBMinute from a datetime that is naive or in UTC"""
         u = d.utctimetuple()
         if newls is None and newut1 is None:
             newut1, newls = cls._get_dut1_info(u.tm_year, u.tm_yday, old_time)
@@ -726,8 +725,8 @@ class WWVBMinuteIERS(WWVBMinute):
 
     @classmethod
     def _get_dut1_info(cls, year: int, days: int, old_time: WWVBMinute | None = None) -> tuple[int, bool]:  # noqa: ARG003
-        d = datetime.datetime(year, 1, 1, tzinfo=datetime.timezone.utc) + datetime.timedelta(days - 1)
-        return int(round(get_dut1(d) * 10)) * 100, isls(d)
+        d = datetime.date(year, 1, 1) + datetime.timedelta(days - 1)
+        return _get_dut1_tenths(d, stacklevel=2) * 100, isls(d)
 
 
 def _bcd_bits(n: int) -> Generator[bool, None, None]:
@@ -758,19 +757,74 @@ class PhaseModulation(enum.IntEnum):
     UNSET = -1
 
 
+# The character str(WWVBTimecode) uses for each (amplitude, phase) pair: plain
+# digits when the phase is unset, otherwise superscript for ONE and subscript
+# for ZERO, with an unset amplitude shown as a question mark
+_TIMECODE_CHARS: dict[tuple[int, int], str] = {
+    (am, phase): chars[am]
+    for phase, chars in (
+        (PhaseModulation.UNSET, "012?"),
+        (PhaseModulation.ONE, "⁰¹²¿"),
+        (PhaseModulation.ZERO, "₀₁₂⸮"),
+    )
+    for am in AmplitudeModulation
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _make_encoder(charset: tuple[str, ...]) -> Callable[[Iterable[int]], str]:
+    """Return a function that converts a sequence of symbols to a string using ``charset``
+
+    The function is created once per distinct charset and closes over it.
+    When every symbol maps to a single ASCII character, as in the default
+    styles, the conversion is a single ``bytes.translate``; otherwise it is a
+    list comprehension and join.
+    """
+
+    def encode(symbols: Iterable[int]) -> str:
+        return "".join([charset[i] for i in symbols])
+
+    if not all(len(c) == 1 and c.isascii() for c in charset):
+        return encode
+
+    # Negative symbols such as UNSET index from the end of charset, as they do
+    # in encode(). Any other byte maps to a non-ASCII value, so that decoding
+    # fails and encode() raises the usual IndexError.
+    chars = "".join(charset).encode("ascii")
+    table = bytearray(b"\xff" * 256)
+    table[: len(chars)] = chars
+    table[-len(chars) :] = chars
+
+    def encode_ascii(symbols: Iterable[int]) -> str:
+        packed = symbols if isinstance(symbols, array.array) else array.array("b", symbols)
+        try:
+            return packed.tobytes().translate(table).decode("ascii")
+        except ValueError:
+            return encode(packed)
+
+    return encode_ascii
+
+
 class WWVBTimecode:
     """Represent the amplitude and/or phase signal, usually over 1 minute"""
 
-    am: list[AmplitudeModulation]
-    """The amplitude modulation data"""
+    am: array.array[int]
+    """The amplitude modulation data, as `AmplitudeModulation` values packed one per byte"""
 
-    phase: list[PhaseModulation]
-    """The phase modulation data"""
+    phase: array.array[int]
+    """The phase modulation data, as `PhaseModulation` values packed one per byte"""
 
     def __init__(self, sz: int) -> None:
         """Construct a WWVB timecode ``sz`` seconds long"""
-        self.am = [AmplitudeModulation.UNSET] * sz
-        self.phase = [PhaseModulation.UNSET] * sz
+        self.am = array.array("b", [AmplitudeModulation.UNSET]) * sz
+        self.phase = array.array("b", [PhaseModulation.UNSET]) * sz
+
+    def clone(self) -> WWVBTimecode:
+        """Return an independent copy of this timecode"""
+        result = WWVBTimecode(0)
+        result.am = self.am[:]
+        result.phase = self.phase[:]
+        return result
 
     def _get_am_bcd(self, *poslist: int) -> int | None:
         """Convert AM data to BCD
@@ -778,14 +832,14 @@ class WWVBTimecode:
         The the bits ``self.am[poslist[i]]`` in MSB order are converted from
         BCD to integer
         """
-        pos = reversed(poslist)
-        val = [bool(self.am[p]) for p in pos]
+        am = self.am
         result = 0
         base = 1
-        for i in range(0, len(val), 4):
+        # Digits are taken 4 bits at a time starting from the least significant end
+        for i in range(len(poslist), 0, -4):
             digit = 0
-            for j, b in enumerate(val[i : i + 4]):
-                digit += b << j
+            for p in poslist[max(0, i - 4) : i]:
+                digit = digit * 2 + (am[p] != 0)
             if digit > 9:
                 return None
             result += digit * base
@@ -800,35 +854,17 @@ class WWVBTimecode:
         Treating 'poslist' as a sequence of indices, update the AM signal with the value as a BCD number
         """
         pos = list(poslist)[::-1]
+        am = self.am
         for p, b in zip(pos, _bcd_bits(v)):
-            if b:
-                self.am[p] = AmplitudeModulation.ONE
-            else:
-                self.am[p] = AmplitudeModulation.ZERO
-
-    def _put_pm_bit(self, i: int, v: PhaseModulation | int | bool) -> None:
-        """Update a bit of the Phase Modulation signal"""
-        self.phase[i] = PhaseModulation(v)
-
-    def _put_pm_bin(self, st: int, n: int, v: int) -> None:
-        """Update an n-digit binary number in the Phase Modulation signal"""
-        for i in range(n):
-            self._put_pm_bit(st + i, _extract_bit(v, (n - i - 1)))
+            am[p] = b
 
     def __str__(self) -> str:
         """Implement str()"""
-        undefined = [i for i in range(len(self.am)) if self.am[i] == AmplitudeModulation.UNSET]
-        if undefined:
+        if AmplitudeModulation.UNSET in self.am:
+            undefined = [i for i, v in enumerate(self.am) if v == AmplitudeModulation.UNSET]
             warnings.warn(f"am{undefined} is unset", stacklevel=1)
 
-        def convert_one(am: AmplitudeModulation, phase: PhaseModulation) -> str:
-            if phase is PhaseModulation.UNSET:
-                return ("0", "1", "2", "?")[am]
-            if phase:
-                return ("⁰", "¹", "²", "¿")[am]
-            return ("₀", "₁", "₂", "⸮")[am]
-
-        return "".join(convert_one(i, j) for i, j in zip(self.am, self.phase))
+        return "".join(map(_TIMECODE_CHARS.__getitem__, zip(self.am, self.phase)))
 
     def __repr__(self) -> str:
         """Implement repr()"""
@@ -836,17 +872,17 @@ class WWVBTimecode:
 
     def to_am_string(self, charset: list[str]) -> str:
         """Convert the amplitude signal to a string"""
-        return "".join(charset[i] for i in self.am)
+        return _make_encoder(tuple(charset))(self.am)
 
     to_string = to_am_string
 
     def to_pm_string(self, charset: list[str]) -> str:
         """Convert the phase signal to a string"""
-        return "".join(charset[i] for i in self.phase)
+        return _make_encoder(tuple(charset))(self.phase)
 
     def to_both_string(self, charset: list[str]) -> str:
         """Convert both channels to a string"""
-        return "".join(charset[i + j * 3] for i, j in zip(self.am, self.phase))
+        return _make_encoder(tuple(charset))(i + j * 3 for i, j in zip(self.am, self.phase))
 
 
 styles = {
@@ -871,28 +907,31 @@ def print_timecodes(
     channel_text = "" if channel == "amplitude" else f" --channel={channel}"
     style_text = "" if style == "default" else f" --style={style}"
     style_chars = styles.get(style, ["0", "1", "2"])
+    # Collect the output and write it all at once, rather than making several
+    # calls to print() per minute.
+    out: list[str] = []
+    emit = out.append
     first = True
     for _ in range(minutes):
         if not first and channel == "both":
-            print(file=file)
+            emit("\n")
         if first or all_timecodes:
             if not first:
-                print(file=file)
-            print(f"WWVB timecode: {w!s}{channel_text}{style_text}", file=file)
+                emit("\n")
+            emit(f"WWVB timecode: {w!s}{channel_text}{style_text}\n")
         first = False
         pfx = f"{w.year:04d}-{w.days:03d} {w.hour:02d}:{w.min:02d} "
         tc = w.as_timecode()
         if len(style_chars) == 6:
-            print(f"{pfx} {tc.to_both_string(style_chars)}", file=file)
-            print(file=file)
-            pfx = " " * len(pfx)
+            emit(f"{pfx} {tc.to_both_string(style_chars)}\n\n")
         else:
             if channel in ("amplitude", "both"):
-                print(f"{pfx} {tc.to_am_string(style_chars)}", file=file)
+                emit(f"{pfx} {tc.to_am_string(style_chars)}\n")
                 pfx = " " * len(pfx)
             if channel in ("phase", "both"):
-                print(f"{pfx} {tc.to_pm_string(style_chars)}", file=file)
+                emit(f"{pfx} {tc.to_pm_string(style_chars)}\n")
         w = w.next_minute()
+    file.write("".join(out))
 
 
 def print_timecodes_json(
@@ -916,22 +955,20 @@ def print_timecodes_json(
     during a minute that includes a (positive) leap second, and theoretically
     length 59 in the case of a negative leap second.
     """
+    # All the values are integers or strings of digits, so each minute's object
+    # can be formatted directly instead of building a dict for json.dump.
+    want_amplitude = channel in ("amplitude", "both")
+    want_phase = channel in ("phase", "both")
     result = []
     for _ in range(minutes):
-        data: dict[str, Any] = {
-            "year": w.year,
-            "days": w.days,
-            "hour": w.hour,
-            "minute": w.min,
-        }
+        data = f'{{"year": {w.year}, "days": {w.days}, "hour": {w.hour}, "minute": {w.min}'
 
         tc = w.as_timecode()
-        if channel in ("amplitude", "both"):
-            data["amplitude"] = tc.to_am_string(["0", "1", "2"])
-        if channel in ("phase", "both"):
-            data["phase"] = tc.to_pm_string(["0", "1"])
+        if want_amplitude:
+            data += f', "amplitude": "{tc.to_am_string(["0", "1", "2"])}"'
+        if want_phase:
+            data += f', "phase": "{tc.to_pm_string(["0", "1"])}"'
 
-        result.append(data)
+        result.append(data + "}")
         w = w.next_minute()
-    json.dump(result, file)
-    print(file=file)
+    file.write(f"[{', '.join(result)}]\n")
@@ -5,13 +5,14 @@
 
 from __future__ import annotations
 
+import array
 import sys
 from typing import TYPE_CHECKING
 
 import wwvb
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable
 
 # State 1: Unsync'd
 #  Marker: State 2
@@ -25,53 +26,72 @@ if TYPE_CHECKING:
 # State 4: Decoding a minute, starting in second 1
 #  Second
 
-always_zero = {4, 10, 11, 14, 20, 21, 34, 35, 44, 54}
+always_zero = frozenset({4, 10, 11, 14, 20, 21, 34, 35, 44, 54})
+
+_MARK = wwvb.AmplitudeModulation.MARK
+
+# The next state from states 1..3, depending on whether the symbol is a marker
+_NEXT_ON_MARK = (0, 2, 3, 3)
+_NEXT_ON_OTHER = (0, 1, 1, 4)
+
+# The symbol each second of a minute must hold, or None if it may hold any
+# symbol except a marker
+_REQUIRED: tuple[int | None, ...] = tuple(
+    _MARK if i % 10 == 9 else wwvb.AmplitudeModulation.ZERO if i in always_zero else None for i in range(60)
+)
+
+
+class WWVBReceiver:
+    """Decode WWVB signals statefully, one symbol at a time"""
+
+    __slots__ = ("minute", "state")
+
+    def __init__(self) -> None:
+        """Construct a receiver that is not yet synchronized to the signal"""
+        self.state = 1
+        self.minute = array.array("b")
+
+    def send(self, value: int) -> wwvb.WWVBTimecode | None:
+        """Process one symbol, returning the timecode of the minute it completes, if any"""
+        state = self.state
+        if state != 4:
+            if value == _MARK:
+                self.state = _NEXT_ON_MARK[state]
+            else:
+                self.state = _NEXT_ON_OTHER[state]
+                if state == 3:
+                    self.minute = array.array("b", [_MARK, value])
+            return None
+
+        minute = self.minute
+        required = _REQUIRED[len(minute)]
+        if (value == _MARK) if required is None else (value != required):
+            # Lost sync; the same symbol is then considered from state 1
+            self.state = _NEXT_ON_MARK[1] if value == _MARK else 1
+            return None
+        minute.append(value)
+        if len(minute) < 60:
+            return None
+        tc = wwvb.WWVBTimecode(60)
+        tc.am = minute
+        self.minute = array.array("b")
+        self.state = 2
+        return tc
+
+    def feed_all(self, values: Iterable[int]) -> list[wwvb.WWVBTimecode]:
+        """Process a run of symbols, returning the timecodes of all the minutes they complete"""
+        return [tc for tc in map(self.send, values) if tc is not None]
 
 
 def wwvbreceive() -> Generator[wwvb.WWVBTimecode | None, wwvb.AmplitudeModulation, None]:
-    """Decode WWVB signals statefully."""
-    minute: list[wwvb.AmplitudeModulation] = []
-    state = 1
+    """Decode WWVB signals statefully.
 
+    This is a generator interface to `WWVBReceiver`.
+    """
+    receiver = WWVBReceiver()
     value = yield None
     while True:
-        # print(state, value, len(minute), "".join(str(int(i)) for i in minute))
-        if state == 1:
-            minute = []
-            if value == wwvb.AmplitudeModulation.MARK:
-                state = 2
-            value = yield None
-
-        elif state == 2:
-            state = 3 if value == wwvb.AmplitudeModulation.MARK else 1
-            value = yield None
-
-        elif state == 3:
-            if value != wwvb.AmplitudeModulation.MARK:
-                state = 4
-                minute = [wwvb.AmplitudeModulation.MARK, value]
-            value = yield None
-
-        else:  #  state == 4:
-            minute.append(value)
-            if len(minute) % 10 == 0 and value != wwvb.AmplitudeModulation.MARK:
-                # print("MISSING MARK", len(minute), "".join(str(int(i)) for i in minute))
-                state = 1
-            elif len(minute) % 10 and value == wwvb.AmplitudeModulation.MARK:
-                # print("UNEXPECTED MARK")
-                state = 1
-            elif len(minute) - 1 in always_zero and value != wwvb.AmplitudeModulation.ZERO:
-                # print("UNEXPECTED NONZERO")
-                state = 1
-            elif len(minute) == 60:
-                # print("FULL MINUTE")
-                tc = wwvb.WWVBTimecode(60)
-                tc.am[:] = minute
-                minute = []
-                state = 2
-                value = yield tc
-            else:
-                value = yield None
+        value = yield receiver.send(value)
 
 
 def main() -> None:
@@ -6,26 +6,30 @@
 
 """Print the table of historical DUT1 values"""
 
+import sys
 from datetime import timedelta
 from itertools import groupby
 
 import wwvb
 
-from .iersdata import DUT1_DATA_START, DUT1_OFFSETS
+from .iersdata import DUT1_DATA_START, DUT1_OFFSETS_INT8
 
 
 def main() -> None:
     """Print the table of historical DUT1 values"""
+    out: list[str] = []
+    emit = out.append
     date = DUT1_DATA_START
-    for key, it in groupby(DUT1_OFFSETS):
-        dut1_ms = (ord(key) - ord("k")) / 10.0
+    for key, it in groupby(DUT1_OFFSETS_INT8):
+        dut1_ms = key / 10.0
         count = len(list(it))
         end = date + timedelta(days=count - 1)
         dut1_next = wwvb.get_dut1(date + timedelta(days=count), warn_outdated=False)
         ls = f" LS on {end:%F} 23:59:60 UTC" if dut1_ms * dut1_next < 0 else ""
-        print(f"{date:%F} {dut1_ms: 3.1f} {count:4d}{ls}")
+        emit(f"{date:%F} {dut1_ms: 3.1f} {count:4d}{ls}\n")
         date += timedelta(days=count)
-    print(date)
+    emit(f"{date}\n")
+    sys.stdout.write("".join(out))
 
 
 if __name__ == "__main__":
@@ -5,33 +5,62 @@
 #
 # SPDX-License-Identifier: GPL-3.0-only
 
+import array
 import binascii
 import datetime
 import gzip
 import importlib.resources
 import json
+import os
+import pathlib
+import sys
 
-import platformdirs
-
-__all__ = ["DUT1_DATA_START", "DUT1_OFFSETS", "end", "span", "start"]
+__all__ = ["DUT1_DATA_START", "DUT1_DATA_START_ORDINAL", "DUT1_OFFSETS", "DUT1_OFFSETS_INT8", "end", "span", "start"]
 
 content: dict[str, str] = {"START": "1970-01-01", "OFFSETS_GZ": "H4sIAFNx1mYC/wMAAAAAAAAAAAA="}
 
 path = importlib.resources.files("wwvb") / "iersdata.json"
 content = json.loads(path.read_text(encoding="utf-8"))
 
-for location in [  # pragma no cover
-    platformdirs.user_data_path("wwvbpy", "unpythonic.net"),
-    platformdirs.site_data_path("wwvbpy", "unpythonic.net"),
-]:
-    path = location / "iersdata.json"
-    if path.exists():
-        content = json.loads(path.read_text(encoding="utf-8"))
-        break
+
+def _may_have_local_data() -> bool:  # pragma no cover
+    """Return False if there is certainly no user or site iersdata.json
+
+    On Linux, platformdirs only chooses locations within the XDG data
+    directories, so checking them directly avoids importing platformdirs in
+    the usual case where no updated data has been installed.
+    """
+    if sys.platform != "linux":
+        return True
+    candidates = [
+        os.environ.get("XDG_DATA_HOME", ""),
+        str(pathlib.Path.home() / ".local" / "share"),
+        *os.environ.get("XDG_DATA_DIRS", "").split(os.pathsep),
+        "/usr/local/share",
+        "/usr/share",
+    ]
+    return any((pathlib.Path(d) / "wwvbpy" / "iersdata.json").exists() for d in candidates if d)
+
+
+if _may_have_local_data():  # pragma no cover
+    import platformdirs
+
+    for location in [
+        platformdirs.user_data_path("wwvbpy", "unpythonic.net"),
+        platformdirs.site_data_path("wwvbpy", "unpythonic.net"),
+    ]:
+        path = location / "iersdata.json"
+        if path.exists():
+            content = json.loads(path.read_text(encoding="utf-8"))
+            break
 
 DUT1_DATA_START = datetime.date.fromisoformat(content["START"])
 DUT1_OFFSETS = gzip.decompress(binascii.a2b_base64(content["OFFSETS_GZ"])).decode("ascii")
 
+# The same data as DUT1_OFFSETS, in units of 100ms and indexed by date.toordinal() - DUT1_DATA_START_ORDINAL
+DUT1_DATA_START_ORDINAL = DUT1_DATA_START.toordinal()
+DUT1_OFFSETS_INT8 = array.array("b", [ord(c) - ord("k") for c in DUT1_OFFSETS])
+
 start = datetime.datetime.combine(DUT1_DATA_START, datetime.time(), tzinfo=datetime.timezone.utc)
 span = datetime.timedelta(days=len(DUT1_OFFSETS))
 end = start + span
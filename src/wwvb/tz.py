@@ -9,4 +9,15 @@ from zoneinfo import ZoneInfo
 
 Mountain = ZoneInfo("America/Denver")
 
-__all__ = ["Mountain", "ZoneInfo"]
+_ZONE_CACHE: dict[str, ZoneInfo] = {"America/Denver": Mountain}
+
+
+def zone(name: str) -> ZoneInfo:
+    """Return the ZoneInfo for ``name``, memoized in a plain dict"""
+    z = _ZONE_CACHE.get(name)
+    if z is None:
+        z = _ZONE_CACHE[name] = ZoneInfo(name)
+    return z
+
+
+__all__ = ["Mountain", "ZoneInfo", "zone"]
@@ -8,19 +8,18 @@
 
 from __future__ import annotations
 
+import array
 import binascii
 import csv
 import datetime
 import gzip
-import io
+import hashlib
 import json
 import pathlib
 from typing import Callable
 
-import bs4
 import click
 import platformdirs
-import requests
 
 DIST_PATH = pathlib.Path(__file__).parent / "iersdata.json"
 
@@ -32,55 +31,135 @@ if IERS_PATH.exists():
 NIST_URL = "https://www.nist.gov/pml/time-and-frequency-division/atomic-standards/leap-second-and-ut1-utc-information"
 
 
-def _get_text(url: str) -> str:
-    """Get a local file or a http/https URL"""
-    if url.startswith("http"):
-        with requests.get(url, timeout=30) as response:
-            return response.text
-    else:
-        return pathlib.Path(url).read_text(encoding="utf-8")
-
-
-def update_iersdata(  # noqa: PLR0915
+CACHE_PATH = platformdirs.user_cache_path("wwvbpy", "unpythonic.net")
+
+
+def _cache_paths(url: str) -> tuple[pathlib.Path, pathlib.Path]:
+    """Return the paths of the cached body and validators for a URL"""
+    stem = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+    return CACHE_PATH / f"{stem}.body", CACHE_PATH / f"{stem}.meta.json"
+
+
+def _fetch(url: str) -> pathlib.Path:
+    """Get a local file or a http/https URL, returning the path of a local copy of the content
+
+    http/https responses are streamed into a cache file, and later requests
+    for the same URL are made conditional on the cached ETag and
+    Last-Modified values so that an unchanged resource is not downloaded
+    again.
+    """
+    if not url.startswith("http"):
+        return pathlib.Path(url)
+
+    import requests
+
+    body_path, meta_path = _cache_paths(url)
+    headers = {}
+    if body_path.exists() and meta_path.exists():
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if etag := meta.get("ETag"):
+            headers["If-None-Match"] = etag
+        if last_modified := meta.get("Last-Modified"):
+            headers["If-Modified-Since"] = last_modified
+
+    with requests.get(url, headers=headers, timeout=30, stream=True) as response:
+        if response.status_code == requests.codes.not_modified:
+            return body_path
+        response.raise_for_status()
+        validators = {k: response.headers[k] for k in ("ETag", "Last-Modified") if k in response.headers}
+
+        CACHE_PATH.mkdir(parents=True, exist_ok=True)
+        # Never pair old validators with a new, possibly incomplete, body
+        meta_path.unlink(missing_ok=True)
+        with body_path.open("wb") as f:
+            for chunk in response.iter_content(chunk_size=65536):
+                f.write(chunk)
+
+    meta_path.write_text(json.dumps(validators), encoding="utf-8")
+    return body_path
+
+
+def _input_digest(*sources: pathlib.Path) -> str:
+    """Return the SHA-256 hex digest of the concatenated content of the sources"""
+    h = hashlib.sha256()
+    for source in sources:
+        with source.open("rb") as f:
+            while chunk := f.read(65536):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def _existing_digest(target_path: pathlib.Path) -> str | None:
+    """Return the input digest recorded in an existing iersdata.json, if any"""
+    try:
+        content = json.loads(target_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return content.get("INPUT_SHA256") if isinstance(content, dict) else None
+
+
+def _read_iers_offsets(iersdata_path: pathlib.Path) -> tuple[datetime.date, array.array[int]]:
+    """Read the DUT1 offsets from the IERS CSV, returning the first date and the offsets in units of 100ms"""
+    offsets = array.array("b")
+    with iersdata_path.open(encoding="utf-8", newline="") as f:
+        # Only two columns are needed, so use plain csv.reader rows instead of
+        # building a DictReader dict for each of the ~20k rows
+        reader = csv.reader(f, delimiter=";")
+        header = next(reader)
+        mjd_col = header.index("MJD")
+        offs_col = header.index("UT1-UTC")
+        for r in reader:
+            offs_str = r[offs_col]
+            if not offs_str:
+                break
+            offs = int(round(float(offs_str) * 10))
+            if not offsets:
+                jd = float(r[mjd_col])
+                table_start = datetime.date(1858, 11, 17) + datetime.timedelta(jd)
+
+                when = min(datetime.date(1972, 1, 1), table_start)
+                # iers bulletin A doesn't cover 1972, so fake data for those
+                # leap seconds
+                for fake_end, fake_offs in (
+                    (datetime.date(1972, 7, 1), -2),
+                    (datetime.date(1972, 11, 1), 8),
+                    (datetime.date(1972, 12, 1), 0),
+                    (datetime.date(1973, 1, 1), -2),
+                    (table_start, 8),
+                ):
+                    if when < fake_end:
+                        offsets.extend(array.array("b", [fake_offs]) * (fake_end - when).days)
+                        when = fake_end
+
+                table_start = min(datetime.date(1972, 1, 1), table_start)
+
+            offsets.append(offs)
+    return table_start, offsets
+
+
+def update_iersdata(
     target_path: pathlib.Path,
 ) -> None:
     """Update iersdata.py"""
-    offsets: list[int] = []
-    iersdata_text = _get_text(IERS_URL)
-    for r in csv.DictReader(io.StringIO(iersdata_text), delimiter=";"):
-        jd = float(r["MJD"])
-        offs_str = r["UT1-UTC"]
-        if not offs_str:
-            break
-        offs = int(round(float(offs_str) * 10))
-        if not offsets:
-            table_start = datetime.date(1858, 11, 17) + datetime.timedelta(jd)
-
-            when = min(datetime.date(1972, 1, 1), table_start)
-            # iers bulletin A doesn't cover 1972, so fake data for those
-            # leap seconds
-            while when < datetime.date(1972, 7, 1):
-                offsets.append(-2)
-                when = when + datetime.timedelta(days=1)
-            while when < datetime.date(1972, 11, 1):
-                offsets.append(8)
-                when = when + datetime.timedelta(days=1)
-            while when < datetime.date(1972, 12, 1):
-                offsets.append(0)
-                when = when + datetime.timedelta(days=1)
-            while when < datetime.date(1973, 1, 1):
-                offsets.append(-2)
-                when = when + datetime.timedelta(days=1)
-            while when < table_start:
-                offsets.append(8)
-                when = when + datetime.timedelta(days=1)
-
-            table_start = min(datetime.date(1972, 1, 1), table_start)
-
-        offsets.append(offs)
-
-    wwvb_text = _get_text(NIST_URL)
-    wwvb_data = bs4.BeautifulSoup(wwvb_text, features="html.parser")
+    import bs4
+
+    iersdata_path = _fetch(IERS_URL)
+    wwvb_path = _fetch(NIST_URL)
+    digest = _input_digest(iersdata_path, wwvb_path)
+    if _existing_digest(target_path) == digest:
+        print(f"{target_path} was already generated from the same data")
+        return
+
+    table_start, offsets = _read_iers_offsets(iersdata_path)
+    wwvb_text = wwvb_path.read_text(encoding="utf-8")
+
+    # Only the tables and the modification-time meta tag are used, so don't
+    # build the rest of the page's tree
+    wwvb_data = bs4.BeautifulSoup(
+        wwvb_text,
+        features="html.parser",
+        parse_only=bs4.SoupStrainer(["table", "meta"]),
+    )
     wwvb_dut1_table = wwvb_data.findAll("table")[2]
     assert wwvb_dut1_table
     meta = wwvb_data.find("meta", property="article:modified_time")
@@ -90,13 +169,14 @@ def update_iersdata(  # noqa: PLR0915
     def patch(patch_start: datetime.date, patch_end: datetime.date, val: int) -> None:
         off_start = (patch_start - table_start).days
         off_end = (patch_end - table_start).days
-        offsets[off_start:off_end] = [val] * (off_end - off_start)
+        offsets[off_start:off_end] = array.array("b", [val]) * (off_end - off_start)
 
     wwvb_dut1: int | None = None
     wwvb_start: datetime.date | None = None
-    for row in wwvb_dut1_table.findAll("tr")[1:][::-1]:
+    # Walk the rows oldest-first, skipping the header row
+    for row in wwvb_dut1_table.findAll("tr")[:0:-1]:
         cells = row.findAll("td")
-        when = datetime.datetime.strptime(cells[0].text + "+0000", "%Y-%m-%d%z").date()
+        when = datetime.date.fromisoformat(cells[0].text)
         dut1 = cells[2].text.replace("s", "").replace(" ", "")
         dut1 = int(round(float(dut1) * 10))
         if wwvb_dut1 is not None:
@@ -122,13 +202,16 @@ def update_iersdata(  # noqa: PLR0915
     base = ord("a") + 10
     offsets_bin = bytes(base + ch for ch in offsets)
 
-    target_path.write_text(
+    # json.dumps output is pure ASCII, so encode it once and write the bytes
+    # directly rather than going through the locale-dependent text layer
+    target_path.write_bytes(
         json.dumps(
             {
                 "START": table_start.isoformat(),
-                "OFFSETS_GZ": binascii.b2a_base64(gzip.compress(offsets_bin)).decode("ascii").strip(),
+                "OFFSETS_GZ": binascii.b2a_base64(gzip.compress(offsets_bin, mtime=0), newline=False).decode("ascii"),
+                "INPUT_SHA256": digest,
             },
-        ),
+        ).encode("ascii"),
     )
 
     print(f"iersdata covers {table_start} .. {table_end}")
@@ -6,8 +6,10 @@
 # SPDX-License-Identifier: GPL-3.0-only
 from __future__ import annotations
 
+import calendar
+import collections
 import functools
-import threading
+import statistics
 import time
 from tkinter import Canvas, TclError, Tk
 from typing import TYPE_CHECKING, Any
@@ -20,23 +22,31 @@ if TYPE_CHECKING:
     from collections.abc import Generator
 
 
-@functools.cache
+_APP: Tk | None = None
+
+
 def _app() -> Tk:
     """Create the Tk application object lazily"""
-    return Tk()
+    global _APP  # noqa: PLW0603
+    if _APP is None:
+        _APP = Tk()
+    return _APP
 
 
 def validate_colors(ctx: Any, param: Any, value: str) -> list[str]:  # noqa: ARG001
     """Check that all colors in a string are valid, splitting it to a list"""
     app = _app()
-    colors = value.split()
-    if len(colors) not in (2, 3, 4, 6):
-        raise click.BadParameter(f"Give 2, 3, 4 or 6 colors (not {len(colors)}")
-    for c in colors:
+    names = value.split()
+    if len(names) not in (2, 3, 4, 6):
+        raise click.BadParameter(f"Give 2, 3, 4 or 6 colors (not {len(names)}")
+    colors = []
+    for c in names:
         try:
-            app.winfo_rgb(c)
+            r, g, b = app.winfo_rgb(c)
         except TclError as e:
             raise click.BadParameter(f"Invalid color {c}") from e
+        # Normalize to #rrggbb so that Tk need not look up color names on each LED change
+        colors.append(f"#{r >> 8:02x}{g >> 8:02x}{b >> 8:02x}")
 
     if len(colors) == 2:
         off, on = colors
@@ -51,6 +61,85 @@ def validate_colors(ctx: Any, param: Any, value: str) -> list[str]:  # noqa: ARG
 
 DEFAULT_COLORS = "#3c3c3c #3c3c3c #3c3c3c #cc3c3c #88883c #3ccc3c"
 
+# How long the LED stays on for each amplitude code (ZERO, ONE, MARK), in ms
+_PULSE_WIDTHS_MS = (200, 500, 800)
+
+# Delay before reshaping the LED after the last of a burst of resize events
+_RESIZE_DEBOUNCE_MS = 50
+
+
+def _now_ms() -> int:
+    """Return the current time in integer ms since the epoch"""
+    return time.time_ns() // 1_000_000
+
+
+def deadline_ms(stamp_ms: int, offset_ms: int = 0) -> int:
+    """Compute the number of ms until ``offset_ms`` after a timestamp given in ms"""
+    return max(0, stamp_ms + offset_ms - _now_ms())
+
+
+@functools.lru_cache(maxsize=4)
+def _minute_am(year: int, days: int, hour: int, minute: int) -> tuple[int, ...]:
+    """Get the amplitude signal for one minute, reusing it when the same minute is requested again"""
+    return tuple(wwvb.WWVBMinuteIERS(year, days, hour, minute).as_timecode().am)
+
+
+def _next_minute(year: int, yday: int, hour: int, minute: int) -> tuple[int, int, int, int]:
+    """Step a UTC (year, day of year, hour, minute) forward by one minute without calling gmtime"""
+    minute += 1
+    if minute < 60:
+        return year, yday, hour, minute
+    hour += 1
+    if hour < 24:
+        return year, yday, hour, 0
+    yday += 1
+    if yday <= 365 + calendar.isleap(year):
+        return year, yday, 0, 0
+    return year + 1, 1, 0, 0
+
+
+def wwvbtick(now_ms: int | None = None) -> Generator[tuple[int, int], None, None]:
+    """Yield consecutive values of the WWVB amplitude signal, going from minute to minute
+
+    Each value is paired with the time its second starts, in integer ms.
+    The seconds of the first minute that are already more than 1s in the past
+    are skipped arithmetically, rather than being yielded and discarded.
+    """
+    if now_ms is None:
+        now_ms = _now_ms()
+    timestamp = now_ms // 60_000 * 60
+    skip = max(0, (now_ms - 1 - timestamp * 1000) // 1000)
+
+    tt = time.gmtime(timestamp)
+    year, yday, hour, minute = tt.tm_year, tt.tm_yday, tt.tm_hour, tt.tm_min
+
+    while True:
+        am = _minute_am(year, yday, hour, minute)
+        stamp_ms = timestamp * 1000
+        yield from zip(range(stamp_ms + skip * 1000, stamp_ms + len(am) * 1000, 1000), am[skip:])
+        skip = 0
+        timestamp = timestamp + 60
+        year, yday, hour, minute = _next_minute(year, yday, hour, minute)
+
+
+def wwvbsmarttick() -> Generator[tuple[int, int], None, None]:
+    """Yield consecutive values of the WWVB amplitude signal
+
+    .. but deal with time progressing unexpectedly, such as when the
+    computer is suspended or NTP steps the clock backwards
+
+    When a time signal is more than 1s in the past, or more than 1s in the
+    future because the clock went backwards, get a fresh wwvbtick object,
+    which resumes directly at the current second.  Restarting within the
+    same minute reuses that minute's cached signal.
+    """
+    while True:
+        for stamp_ms, code in wwvbtick():
+            now_ms = _now_ms()
+            if not now_ms - 1000 <= stamp_ms <= now_ms + 1000:
+                break
+            yield stamp_ms, code
+
 
 @click.command
 @click.option("--colors", callback=validate_colors, default=DEFAULT_COLORS)
@@ -61,42 +150,6 @@ def main(colors: list[str], size: int, min_size: int | None) -> None:  # noqa: P
     if min_size is None:
         min_size = size
 
-    def sleep_deadline(deadline: float) -> None:
-        """Sleep until a deadline"""
-        now = time.time()
-        if deadline > now:
-            time.sleep(deadline - now)
-
-    def wwvbtick() -> Generator[tuple[float, wwvb.AmplitudeModulation], None, None]:
-        """Yield consecutive values of the WWVB amplitude signal, going from minute to minute"""
-        timestamp = time.time() // 60 * 60
-
-        while True:
-            tt = time.gmtime(timestamp)
-            key = tt.tm_year, tt.tm_yday, tt.tm_hour, tt.tm_min
-            timecode = wwvb.WWVBMinuteIERS(*key).as_timecode()
-            for i, code in enumerate(timecode.am):
-                yield timestamp + i, code
-            timestamp = timestamp + 60
-
-    def wwvbsmarttick() -> Generator[tuple[float, wwvb.AmplitudeModulation], None, None]:
-        """Yield consecutive values of the WWVB amplitude signal
-
-        .. but deal with time progressing unexpectedly, such as when the
-        computer is suspended or NTP steps the clock backwards
-
-        When time goes backwards or advances by more than a minute, get a fresh
-        wwvbtick object; otherwise, discard time signals more than 1s in the past.
-        """
-        while True:
-            for stamp, code in wwvbtick():
-                now = time.time()
-                if stamp < now - 60:
-                    break
-                if stamp < now - 1:
-                    continue
-                yield stamp, code
-
     app = _app()
     app.wm_minsize(min_size, min_size)
     canvas = Canvas(app, width=size, height=size, highlightthickness=0)
@@ -104,41 +157,100 @@ def main(colors: list[str], size: int, min_size: int | None) -> None:  # noqa: P
     canvas.pack(fill="both", expand=True)
     app.wm_deiconify()
 
-    def resize_canvas(event: Any) -> None:
-        """Keep the circle filling the window when it is resized"""
-        sz = min(event.width, event.height) - 8
+    resize_after_id: str | None = None
+
+    def resize_circle(width: int, height: int) -> None:
+        """Make the circle fill a canvas of the given size"""
+        nonlocal resize_after_id
+        resize_after_id = None
+        sz = min(width, height) - 8
         if sz < 0:
             return
         canvas.coords(
             circle,
-            event.width // 2 - sz // 2,
-            event.height // 2 - sz // 2,
-            event.width // 2 + sz // 2,
-            event.height // 2 + sz // 2,
+            width // 2 - sz // 2,
+            height // 2 - sz // 2,
+            width // 2 + sz // 2,
+            height // 2 + sz // 2,
         )
 
+    def resize_canvas(event: Any) -> None:
+        """Keep the circle filling the window when it is resized
+
+        Interactive resizing produces a burst of events, so only act on the
+        last one in each burst.
+        """
+        nonlocal resize_after_id
+        if resize_after_id is not None:
+            app.after_cancel(resize_after_id)
+        resize_after_id = app.after(_RESIZE_DEBOUNCE_MS, resize_circle, event.width, event.height)
+
     canvas.bind("<Configure>", resize_canvas)
 
+    # Issue the Tcl command directly, skipping the option-dict handling in
+    # Canvas.itemconfigure, since the LED changes twice a second
+    tkcall = canvas.tk.call
+    canvas_path = str(canvas)
+
     def led_on(i: int) -> None:
         """Turn the canvas's virtual LED on"""
-        canvas.itemconfigure(circle, fill=colors[i + 3])
+        tkcall(canvas_path, "itemconfigure", circle, "-fill", colors[i + 3])
 
     def led_off(i: int) -> None:
         """Turn the canvas's virtual LED off"""
-        canvas.itemconfigure(circle, fill=colors[i])
+        tkcall(canvas_path, "itemconfigure", circle, "-fill", colors[i])
 
-    def thread_func() -> None:
-        """Update the canvas virtual LED"""
-        for stamp, code in wwvbsmarttick():
-            sleep_deadline(stamp)
+    def controller_func() -> Generator[int, None, None]:
+        """Update the canvas virtual LED, yielding the number of ms until the next change"""
+        for stamp_ms, code in wwvbsmarttick():
+            yield deadline_ms(stamp_ms)
             led_on(code)
-            app.update()
-            sleep_deadline(stamp + 0.2 + 0.3 * int(code))
+            yield deadline_ms(stamp_ms, _PULSE_WIDTHS_MS[code])
             led_off(code)
-            app.update()
 
-    thread = threading.Thread(target=thread_func, daemon=True)
-    thread.start()
+    controller = controller_func().__next__
+    lateness_ms: collections.deque[int] = collections.deque(maxlen=32)
+    target_ns: int | None = None
+    visible = True
+    scheduled = True
+
+    def after_func() -> None:
+        """Repeatedly run the controller after the desired interval
+
+        Everything runs on the Tk thread from the event loop, so there is no
+        worker thread making cross-thread Tcl calls or forcing app.update().
+
+        app.after only guarantees a minimum delay, so track how late recent
+        callbacks ran and request correspondingly shorter intervals.
+        """
+        nonlocal target_ns, scheduled
+        if not visible:
+            # Stop until the window is mapped again; wwvbsmarttick will then
+            # skip over the ticks that were missed
+            scheduled = False
+            target_ns = None
+            return
+        if target_ns is not None:
+            lateness_ms.append((time.monotonic_ns() - target_ns) // 1_000_000)
+        ms = controller()
+        if lateness_ms:
+            ms -= max(0, min(ms - 1, int(statistics.median(lateness_ms))))
+        target_ns = time.monotonic_ns() + ms * 1_000_000
+        app.after(ms, after_func)
+
+    def set_visible(event: Any, *, is_visible: bool) -> None:
+        """Track whether the window is mapped, restarting the LED when it is shown again"""
+        nonlocal visible, scheduled
+        if event.widget is not app:
+            return
+        visible = is_visible
+        if visible and not scheduled:
+            scheduled = True
+            app.after_idle(after_func)
+
+    app.bind("<Map>", functools.partial(set_visible, is_visible=True))
+    app.bind("<Unmap>", functools.partial(set_visible, is_visible=False))
+    app.after_idle(after_func)
     app.mainloop()
 
 
@@ -6,14 +6,21 @@
 #
 # SPDX-License-Identifier: GPL-3.0-only
 
+import concurrent.futures
+import contextlib
+import importlib
+import io
 import json
 import os
 import subprocess
 import sys
 import unittest
+import unittest.mock
 from collections.abc import Sequence
 from typing import Any
 
+import click
+
 coverage_add = ("-m", "coverage", "run", "--branch", "-p") if "COVERAGE_RUN" in os.environ else ()
 
 
@@ -29,7 +36,30 @@ class CLITestCase(unittest.TestCase):
         return (sys.executable, *coverage_add, "-m", *args)
 
     def moduleOutput(self, *args: str) -> str:
-        return self.programOutput(sys.executable, *coverage_add, "-m", *args)
+        if coverage_add:
+            return self.programOutput(sys.executable, *coverage_add, "-m", *args)
+        return self.moduleOutputInProcess(*args)
+
+    def moduleOutputs(self, *argsets: Sequence[str]) -> list[str]:
+        """Get the output of several `python -m modulename` programs
+
+        When they run as subprocesses, they are run concurrently.
+        """
+        if not coverage_add:
+            return [self.moduleOutput(*args) for args in argsets]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            return list(pool.map(lambda args: self.moduleOutput(*args), argsets))
+
+    def moduleOutputInProcess(self, module: str, *args: str) -> str:
+        """Run the main() of a `python -m modulename` program in this process, returning its output"""
+        main = importlib.import_module(module).main
+        argv = [module, *args]
+        with contextlib.redirect_stdout(io.StringIO()) as output, unittest.mock.patch.object(sys, "argv", argv):
+            if isinstance(main, click.Command):
+                main.main(list(args), standalone_mode=False)
+            else:
+                main()
+        return output.getvalue()
 
     def assertProgramOutput(self, expected: str, *args: str) -> None:
         """Check the output from invoking a program matches the expected"""
@@ -49,11 +79,23 @@ class CLITestCase(unittest.TestCase):
     def assertStarts(self, expected: str, actual: str, *args: str) -> None:
         self.assertMultiLineEqual(expected, actual[: len(expected)], f"args={args}")
 
+    def assertModuleOutputs(self, *cases: tuple[str, Sequence[str]]) -> None:
+        """Check the outputs from invoking several `python -m modulename` programs match the expected"""
+        actuals = self.moduleOutputs(*(args for _, args in cases))
+        for (expected, args), actual in zip(cases, actuals):
+            self.assertMultiLineEqual(expected, actual, f"args={args}")
+
     def assertModuleJson(self, expected: Any, *args: str) -> None:
         """Check the output from invoking a `python -m modulename` program matches the expected"""
         actual = self.moduleOutput(*args)
         self.assertEqual(json.loads(actual), expected)
 
+    def assertModuleJsons(self, *cases: tuple[Any, Sequence[str]]) -> None:
+        """Check the outputs from invoking several `python -m modulename` programs match the expected"""
+        actuals = self.moduleOutputs(*(args for _, args in cases))
+        for (expected, args), actual in zip(cases, actuals):
+            self.assertEqual(json.loads(actual), expected, f"args={args}")
+
     def assertModuleOutputStarts(self, expected: str, *args: str) -> None:
         """Check the output from invoking a `python -m modulename` program matches the expected"""
         actual = self.moduleOutput(*args)
@@ -78,75 +120,48 @@ class CLITestCase(unittest.TestCase):
 
     def test_gen(self) -> None:
         """Test wwvb.gen"""
-        self.assertModuleOutput(
-            """\
+        self.assertModuleOutputs(
+            (
+                """\
 WWVB timecode: year=2020 days=001 hour=12 min=30 dst=0 ut1=-200 ly=1 ls=0
 2020-001 12:30  201100000200010001020000000002000100010200100001020000010002
 """,
-            "wwvb.gen",
-            "-m",
-            "1",
-            "2020-1-1 12:30",
-        )
-
-        self.assertModuleOutput(
-            """\
+                ("wwvb.gen", "-m", "1", "2020-1-1 12:30"),
+            ),
+            (
+                """\
 WWVB timecode: year=2020 days=001 hour=12 min=30 dst=0 ut1=-200 ly=1 ls=0
 2020-001 12:30  201100000200010001020000000002000100010200100001020000010002
 """,
-            "wwvb.gen",
-            "-m",
-            "1",
-            "2020",
-            "1",
-            "12",
-            "30",
-        )
-
-        self.assertModuleOutput(
-            """\
+                ("wwvb.gen", "-m", "1", "2020", "1", "12", "30"),
+            ),
+            (
+                """\
 WWVB timecode: year=2020 days=001 hour=12 min=30 dst=0 ut1=-200 ly=1 ls=0
 2020-001 12:30  201100000200010001020000000002000100010200100001020000010002
 """,
-            "wwvb.gen",
-            "-m",
-            "1",
-            "2020",
-            "1",
-            "1",
-            "12",
-            "30",
-        )
-
-        self.assertModuleError("wwvb.gen", "-m", "1", "2021", "7")
-
-        # Asserting a leap second
-        self.assertModuleOutput(
-            """\
+                ("wwvb.gen", "-m", "1", "2020", "1", "1", "12", "30"),
+            ),
+            # Asserting a leap second
+            (
+                """\
 WWVB timecode: year=2020 days=001 hour=12 min=30 dst=0 ut1=-500 ly=1 ls=1
 2020-001 12:30  201100000200010001020000000002000100010201010001020000011002
 """,
-            "wwvb.gen",
-            "-m",
-            "1",
-            "-s",
-            "2020-1-1 12:30",
-        )
-
-        # Asserting a different ut1 value
-        self.assertModuleOutput(
-            """\
+                ("wwvb.gen", "-m", "1", "-s", "2020-1-1 12:30"),
+            ),
+            # Asserting a different ut1 value
+            (
+                """\
 WWVB timecode: year=2020 days=001 hour=12 min=30 dst=0 ut1=-300 ly=1 ls=0
 2020-001 12:30  201100000200010001020000000002000100010200110001020000010002
 """,
-            "wwvb.gen",
-            "-m",
-            "1",
-            "-d",
-            "-300",
-            "2020-1-1 12:30",
+                ("wwvb.gen", "-m", "1", "-d", "-300", "2020-1-1 12:30"),
+            ),
         )
 
+        self.assertModuleError("wwvb.gen", "-m", "1", "2021", "7")
+
     def test_dut1table(self) -> None:
         """Test the dut1table program"""
         self.assertModuleOutputStarts(
@@ -161,85 +176,66 @@ WWVB timecode: year=2020 days=001 hour=12 min=30 dst=0 ut1=-300 ly=1 ls=0
 
     def test_json(self) -> None:
         """Test the JSON output format"""
-        self.assertModuleJson(
-            [
-                {
-                    "year": 2021,
-                    "days": 340,
-                    "hour": 3,
-                    "minute": 40,
-                    "amplitude": "210000000200000001120011001002000000010200010001020001000002",
-                    "phase": "111110011011010101000100100110011110001110111010111101001011",
-                },
-                {
-                    "year": 2021,
-                    "days": 340,
-                    "hour": 3,
-                    "minute": 41,
-                    "amplitude": "210000001200000001120011001002000000010200010001020001000002",
-                    "phase": "001010011100100011000101110000100001101000001111101100000010",
-                },
-            ],
-            "wwvb.gen",
-            "-m",
-            "2",
-            "--style",
-            "json",
-            "--channel",
-            "both",
-            "2021-12-6 3:40",
-        )
-        self.assertModuleJson(
-            [
-                {
-                    "year": 2021,
-                    "days": 340,
-                    "hour": 3,
-                    "minute": 40,
-                    "amplitude": "210000000200000001120011001002000000010200010001020001000002",
-                },
-                {
-                    "year": 2021,
-                    "days": 340,
-                    "hour": 3,
-                    "minute": 41,
-                    "amplitude": "210000001200000001120011001002000000010200010001020001000002",
-                },
-            ],
-            "wwvb.gen",
-            "-m",
-            "2",
-            "--style",
-            "json",
-            "--channel",
-            "amplitude",
-            "2021-12-6 3:40",
-        )
-        self.assertModuleJson(
-            [
-                {
-                    "year": 2021,
-                    "days": 340,
-                    "hour": 3,
-                    "minute": 40,
-                    "phase": "111110011011010101000100100110011110001110111010111101001011",
-                },
-                {
-                    "year": 2021,
-                    "days": 340,
-                    "hour": 3,
-                    "minute": 41,
-                    "phase": "001010011100100011000101110000100001101000001111101100000010",
-                },
-            ],
-            "wwvb.gen",
-            "-m",
-            "2",
-            "--style",
-            "json",
-            "--channel",
-            "phase",
-            "2021-12-6 3:40",
+        self.assertModuleJsons(
+            (
+                [
+                    {
+                        "year": 2021,
+                        "days": 340,
+                        "hour": 3,
+                        "minute": 40,
+                        "amplitude": "210000000200000001120011001002000000010200010001020001000002",
+                        "phase": "111110011011010101000100100110011110001110111010111101001011",
+                    },
+                    {
+                        "year": 2021,
+                        "days": 340,
+                        "hour": 3,
+                        "minute": 41,
+                        "amplitude": "210000001200000001120011001002000000010200010001020001000002",
+                        "phase": "001010011100100011000101110000100001101000001111101100000010",
+                    },
+                ],
+                ("wwvb.gen", "-m", "2", "--style", "json", "--channel", "both", "2021-12-6 3:40"),
+            ),
+            (
+                [
+                    {
+                        "year": 2021,
+                        "days": 340,
+                        "hour": 3,
+                        "minute": 40,
+                        "amplitude": "210000000200000001120011001002000000010200010001020001000002",
+                    },
+                    {
+                        "year": 2021,
+                        "days": 340,
+                        "hour": 3,
+                        "minute": 41,
+                        "amplitude": "210000001200000001120011001002000000010200010001020001000002",
+                    },
+                ],
+                ("wwvb.gen", "-m", "2", "--style", "json", "--channel", "amplitude", "2021-12-6 3:40"),
+            ),
+            (
+                [
+                    {
+                        "year": 2021,
+                        "days": 340,
+                        "hour": 3,
+                        "minute": 40,
+                        "phase": "111110011011010101000100100110011110001110111010111101001011",
+                    },
+                    {
+                        "year": 2021,
+                        "days": 340,
+                        "hour": 3,
+                        "minute": 41,
+                        "phase": "001010011100100011000101110000100001101000001111101100000010",
+                    },
+                ],
+                ("wwvb.gen", "-m", "2", "--style", "json", "--channel", "phase", "2021-12-6 3:40"),
+            ),
         )
 
     def test_sextant(self) -> None:
@@ -18,12 +18,7 @@ ONE_DAY = datetime.timedelta(days=1)
 
 def next_month(d: datetime.date) -> datetime.date:
     """Return the start of the next month after the day 'd'"""
-    d = d.replace(day=28)
-    while True:
-        d0 = d
-        d = d + ONE_DAY
-        if d.month != d0.month:
-            return d
+    return d.replace(year=d.year + (d.month == 12), month=d.month % 12 + 1, day=1)
 
 
 class TestLeapSecond(unittest.TestCase):
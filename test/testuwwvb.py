@@ -19,10 +19,54 @@ import wwvb
 
 EitherDatetimeOrNone = Union[None, datetime.datetime, adafruit_datetime.datetime]
 
+# Sign bit triples for am[36:39] that uwwvb.decode_wwvb must reject
+_INVALID_UT1_SIGNS = tuple(tuple((i >> b) & 1 for b in range(3)) for i in range(8) if i not in (0b101, 0b010))
+
+# Seeded junk fed to WWVBDecoder.update before the 2012 minute in test_noise
+_NOISE_JUNK = tuple(
+    random.Random(408).choices(
+        [
+            wwvb.AmplitudeModulation.MARK,
+            wwvb.AmplitudeModulation.ONE,
+            wwvb.AmplitudeModulation.ZERO,
+        ],
+        k=480,
+    ),
+)
+
 
 class WWVBRoundtrip(unittest.TestCase):
     """tests of uwwvb.py"""
 
+    minute_2012: wwvb.WWVBMinute
+    timecode_2012: wwvb.WWVBTimecode
+    am_2012: tuple[int, ...]
+    invalid_bcd_inputs: list[tuple[tuple[int, ...], list[int]]]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Compute the minute around the 2012 leap second, and inputs derived from it, once"""
+        cls.minute_2012 = wwvb.WWVBMinuteIERS.from_datetime(
+            datetime.datetime(2012, 6, 30, 23, 50, tzinfo=datetime.timezone.utc),
+        )
+        cls.timecode_2012 = cls.minute_2012.as_timecode()
+        cls.am_2012 = tuple(cls.timecode_2012.am)
+        cls.invalid_bcd_inputs = []
+        for poslist in (
+            (1, 2, 3, 4),  # tens minutes
+            (5, 6, 7, 8),  # ones minutes
+            (15, 16, 17, 18),  # tens hours
+            (25, 26, 27, 28),  # tens days
+            (30, 31, 32, 33),  # ones days
+            (40, 41, 42, 43),  # tens years
+            (45, 46, 47, 48),  # ones years
+            (50, 51, 52, 53),  # ones dut1
+        ):
+            test_input = list(cls.am_2012)
+            for pi in poslist:
+                test_input[pi] = 1
+            cls.invalid_bcd_inputs.append((poslist, test_input))
+
     def assertDateTimeEqualExceptTzInfo(self, a: EitherDatetimeOrNone, b: EitherDatetimeOrNone) -> None:
         """Test two datetime objects for equality
 
@@ -40,8 +84,7 @@ class WWVBRoundtrip(unittest.TestCase):
 
         Each minute must decode and match the primary decoder.
         """
-        minute = wwvb.WWVBMinuteIERS.from_datetime(datetime.datetime(2012, 6, 30, 23, 50, tzinfo=datetime.timezone.utc))
-        assert minute
+        minute = self.minute_2012
         decoder = uwwvb.WWVBDecoder()
         decoder.update(uwwvb.MARK)
         any_leap_second = False
@@ -51,7 +94,9 @@ class WWVBRoundtrip(unittest.TestCase):
             if len(timecode.am) == 61:
                 any_leap_second = True
             for code in timecode.am:
-                decoded = uwwvb.decode_wwvb(decoder.update(int(code))) or decoded
+                received = decoder.update(code)
+                if received is not None:
+                    decoded = uwwvb.decode_wwvb(received) or decoded
             assert decoded
             self.assertDateTimeEqualExceptTzInfo(
                 minute.as_datetime_utc(),
@@ -67,7 +112,7 @@ class WWVBRoundtrip(unittest.TestCase):
         while dt.year < 2013:
             minute = wwvb.WWVBMinuteIERS.from_datetime(dt)
             assert minute
-            decoded = uwwvb.decode_wwvb([int(i) for i in minute.as_timecode().am])
+            decoded = uwwvb.decode_wwvb(minute.as_timecode().am)
             assert decoded
             self.assertDateTimeEqualExceptTzInfo(minute.as_datetime_utc(), uwwvb.as_datetime_utc(decoded))
             dt = dt + delta
@@ -90,12 +135,9 @@ class WWVBRoundtrip(unittest.TestCase):
             datetime.datetime(2021, 7, 7, 9, 1, tzinfo=datetime.timezone.utc),
         ):
             minute = wwvb.WWVBMinuteIERS.from_datetime(dt)
-            decoded = uwwvb.decode_wwvb([int(i) for i in minute.as_timecode().am])
+            decoded = uwwvb.decode_wwvb(minute.as_timecode().am)
             assert decoded
             self.assertDateTimeEqualExceptTzInfo(minute.as_datetime_local(), uwwvb.as_datetime_local(decoded))
-
-            decoded = uwwvb.decode_wwvb([int(i) for i in minute.as_timecode().am])
-            assert decoded
             self.assertDateTimeEqualExceptTzInfo(
                 minute.as_datetime_local(dst_observed=False),
                 uwwvb.as_datetime_local(decoded, dst_observed=False),
@@ -103,22 +145,9 @@ class WWVBRoundtrip(unittest.TestCase):
 
     def test_noise(self) -> None:
         """Test of the state-machine decoder when faced with pseudorandom noise"""
-        minute = wwvb.WWVBMinuteIERS.from_datetime(
-            datetime.datetime(2012, 6, 30, 23, 50, tzinfo=datetime.timezone.utc),
-        )
-        r = random.Random(408)
-        junk = [
-            r.choice(
-                [
-                    wwvb.AmplitudeModulation.MARK,
-                    wwvb.AmplitudeModulation.ONE,
-                    wwvb.AmplitudeModulation.ZERO,
-                ],
-            )
-            for _ in range(480)
-        ]
-        timecode = minute.as_timecode()
-        test_input = [*junk, wwvb.AmplitudeModulation.MARK, *timecode.am]
+        minute = self.minute_2012
+        timecode = self.timecode_2012
+        test_input = [*_NOISE_JUNK, wwvb.AmplitudeModulation.MARK, *timecode.am]
         decoder = uwwvb.WWVBDecoder()
         for code in test_input[:-1]:
             decoded = decoder.update(code)
@@ -138,35 +167,29 @@ class WWVBRoundtrip(unittest.TestCase):
 
     def test_noise2(self) -> None:
         """Test of the full minute decoder with targeted errors to get full coverage"""
-        minute = wwvb.WWVBMinuteIERS.from_datetime(
-            datetime.datetime(2012, 6, 30, 23, 50, tzinfo=datetime.timezone.utc),
-        )
-        timecode = minute.as_timecode()
-        decoded = uwwvb.decode_wwvb([int(i) for i in timecode.am])
+        self.assertIsNone(uwwvb.decode_wwvb(None))
+        decoded = uwwvb.decode_wwvb(list(self.am_2012))
         self.assertIsNotNone(decoded)
+        # One working copy is corrupted and restored in place for each case
+        test_input = list(self.am_2012)
         for position in uwwvb.always_mark:
-            test_input = [int(i) for i in timecode.am]
             for noise in (0, 1):
                 test_input[position] = noise
                 decoded = uwwvb.decode_wwvb(test_input)
                 self.assertIsNone(decoded)
+            test_input[position] = self.am_2012[position]
         for position in uwwvb.always_zero:
-            test_input = [int(i) for i in timecode.am]
             for noise in (1, 2):
                 test_input[position] = noise
                 decoded = uwwvb.decode_wwvb(test_input)
                 self.assertIsNone(decoded)
-        for i in range(8):
-            if i in (0b101, 0b010):  # Test the 6 impossible bit-combos
-                continue
-            test_input = [int(i) for i in timecode.am]
-            test_input[36] = i & 1
-            test_input[37] = (i >> 1) & 1
-            test_input[38] = (i >> 2) & 1
+            test_input[position] = self.am_2012[position]
+        for bits in _INVALID_UT1_SIGNS:
+            test_input[36:39] = bits
             decoded = uwwvb.decode_wwvb(test_input)
             self.assertIsNone(decoded)
+        test_input[36:39] = self.am_2012[36:39]
         # Invalid year-day
-        test_input = [int(i) for i in timecode.am]
         test_input[22] = 1
         test_input[23] = 1
         test_input[25] = 1
@@ -175,25 +198,8 @@ class WWVBRoundtrip(unittest.TestCase):
 
     def test_noise3(self) -> None:
         """Test impossible BCD values"""
-        minute = wwvb.WWVBMinuteIERS.from_datetime(
-            datetime.datetime(2012, 6, 30, 23, 50, tzinfo=datetime.timezone.utc),
-        )
-        timecode = minute.as_timecode()
-
-        for poslist in [
-            [1, 2, 3, 4],  # tens minutes
-            [5, 6, 7, 8],  # ones minutes
-            [15, 16, 17, 18],  # tens hours
-            [25, 26, 27, 28],  # tens days
-            [30, 31, 32, 33],  # ones days
-            [40, 41, 42, 43],  # tens years
-            [45, 46, 47, 48],  # ones years
-            [50, 51, 52, 53],  # ones dut1
-        ]:
+        for poslist, test_input in self.invalid_bcd_inputs:
             with self.subTest(test=poslist):
-                test_input = [int(i) for i in timecode.am]
-                for pi in poslist:
-                    test_input[pi] = 1
                 decoded = uwwvb.decode_wwvb(test_input)
                 self.assertIsNone(decoded)
 
@@ -209,7 +215,7 @@ class WWVBRoundtrip(unittest.TestCase):
         """
         minute = wwvb.WWVBMinuteIERS.from_datetime(datetime.datetime(2021, 1, 1, 0, 0, tzinfo=datetime.timezone.utc))
         timecode = minute.as_timecode()
-        decoded = uwwvb.decode_wwvb([int(i) for i in timecode.am])
+        decoded = uwwvb.decode_wwvb(timecode.am)
         assert decoded
         self.assertDateTimeEqualExceptTzInfo(
             datetime.datetime(2020, 12, 31, 17, 00, tzinfo=zoneinfo.ZoneInfo("America/Denver")),  # Mountain time!
@@ -9,11 +9,12 @@
 
 from __future__ import annotations
 
-import copy
 import datetime
 import io
+import os
 import pathlib
 import random
+import re
 import sys
 import unittest
 
@@ -21,6 +22,26 @@ import uwwvb
 import wwvb
 from wwvb import decode, iersdata, tz
 
+_COMMENT_RE = re.compile(rb"(?m)^#.*(?:\n|$)")
+_HEADER_RE = re.compile(r"(?m)^WWVB timecode")
+_AM_BY_INT = [wwvb.AmplitudeModulation.ZERO, wwvb.AmplitudeModulation.ONE, wwvb.AmplitudeModulation.MARK]
+# UT1 sign patterns for am[36:39] that from_timecode_am must reject: every
+# combination except the two valid ones, 0b010 and 0b101
+_INVALID_UT1_SIGNS = tuple(
+    tuple(_AM_BY_INT[(i >> b) & 1] for b in range(3)) for i in range(8) if i not in (0b101, 0b010)
+)
+# Seeded noise that WWVBReceiver must not mistake for a minute in test_noise
+_NOISE_JUNK = tuple(
+    random.Random(408).choices(
+        [
+            wwvb.AmplitudeModulation.MARK,
+            wwvb.AmplitudeModulation.ONE,
+            wwvb.AmplitudeModulation.ZERO,
+        ],
+        k=480,
+    ),
+)
+
 
 class WWVBMinute2k(wwvb.WWVBMinute):
     """Treats the origin of the 2-digit epoch as 2000"""
@@ -35,38 +56,36 @@ class WWVBTestCase(unittest.TestCase):
 
     def test_cases(self) -> None:
         """Generate a test case for each expected output in tests/"""
-        for test in ((pathlib.Path(__file__).parent) / "wwvbgen_testcases").glob("*"):
+        result = io.StringIO()
+        with os.scandir(pathlib.Path(__file__).parent / "wwvbgen_testcases") as it:
+            tests = [pathlib.Path(entry.path) for entry in it if entry.is_file()]
+        for test in tests:
             with self.subTest(test=test):
-                text = test.read_text(encoding="utf-8")
-                lines = [line for line in text.split("\n") if not line.startswith("#")]
-                while not lines[0]:
-                    del lines[0]
-                text = "\n".join(lines)
+                text = _COMMENT_RE.sub(b"", test.read_bytes()).lstrip(b"\n").decode("utf-8")
+                lines = text.split("\n")
                 header = lines[0].split()
                 timestamp = " ".join(header[:10])
                 options = header[10:]
-                channel = "amplitude"
-                style = "default"
+                opts = {"--channel": "amplitude", "--style": "default"}
                 for o in options:
-                    if o.startswith("--channel="):
-                        channel = o[10:]
-                    elif o.startswith("--style="):
-                        style = o[8:]
-                    else:
+                    name, eq, value = o.partition("=")
+                    if not eq or name not in opts:
                         raise ValueError(f"Unknown option {o!r}")
-                num_minutes = len(lines) - 2
-                if channel == "both":
-                    num_minutes = len(lines) // 3
-
-                num_headers = sum(line.startswith("WWVB timecode") for line in lines)
-                if num_headers > 1:
-                    all_timecodes = True
+                    opts[name] = value
+                channel = opts["--channel"]
+                style = opts["--style"]
+                num_headers = len(_HEADER_RE.findall(text))
+                all_timecodes = num_headers > 1
+                if all_timecodes:
                     num_minutes = num_headers
+                elif channel == "both":
+                    num_minutes = len(lines) // 3
                 else:
-                    all_timecodes = False
+                    num_minutes = len(lines) - 2
 
                 w = wwvb.WWVBMinute.fromstring(timestamp)
-                result = io.StringIO()
+                result.seek(0)
+                result.truncate(0)
                 wwvb.print_timecodes(
                     w,
                     num_minutes,
@@ -82,26 +101,34 @@ class WWVBTestCase(unittest.TestCase):
 class WWVBRoundtrip(unittest.TestCase):
     """Round-trip tests"""
 
+    minute_1992: wwvb.WWVBMinute
+    minute_2012: wwvb.WWVBMinute
+    timecode_2012: wwvb.WWVBTimecode
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Compute the minutes around the 1992 and 2012 leap seconds once, for the tests that share them"""
+        cls.minute_1992 = wwvb.WWVBMinuteIERS.from_datetime(
+            datetime.datetime(1992, 6, 30, 23, 50, tzinfo=datetime.timezone.utc),
+        )
+        cls.minute_2012 = wwvb.WWVBMinuteIERS.from_datetime(
+            datetime.datetime(2012, 6, 30, 23, 50, tzinfo=datetime.timezone.utc),
+        )
+        cls.timecode_2012 = cls.minute_2012.as_timecode()
+
     def test_decode(self) -> None:
         """Test that a range of minutes including a leap second are correctly decoded by the state-based decoder"""
-        minute = wwvb.WWVBMinuteIERS.from_datetime(datetime.datetime(1992, 6, 30, 23, 50, tzinfo=datetime.timezone.utc))
-        decoder = decode.wwvbreceive()
-        next(decoder)
+        minute = self.minute_1992
+        decoder = decode.WWVBReceiver()
         decoder.send(wwvb.AmplitudeModulation.MARK)
         any_leap_second = False
         for _ in range(20):
             timecode = minute.as_timecode()
-            decoded: wwvb.WWVBTimecode | None = None
             if len(timecode.am) == 61:
                 any_leap_second = True
-            for code in timecode.am:
-                decoded = decoder.send(code) or decoded
-            assert decoded
-            self.assertEqual(
-                timecode.am[:60],
-                decoded.am,
-                f"Checking equality of minute {minute}: [expected] {timecode.am} != [actual] {decoded.am}",
-            )
+            [decoded] = decoder.feed_all(timecode.am)
+            if timecode.am[:60] != decoded.am:
+                self.fail(f"Checking equality of minute {minute}: [expected] {timecode.am} != [actual] {decoded.am}")
             minute = minute.next_minute()
         self.assertTrue(any_leap_second)
 
@@ -123,43 +150,27 @@ class WWVBRoundtrip(unittest.TestCase):
     def test_roundtrip(self) -> None:
         """Test that a wide of minutes are correctly decoded by the state-based decoder"""
         dt = datetime.datetime(1992, 1, 1, 0, 0, tzinfo=datetime.timezone.utc)
-        delta = datetime.timedelta(minutes=915 if sys.implementation.name == "cpython" else 86400 - 915)
+        delta = datetime.timedelta(minutes=457 if sys.implementation.name == "cpython" else 86400 - 915)
         while dt.year < 1993:
             minute = wwvb.WWVBMinuteIERS.from_datetime(dt)
             assert minute is not None
-            timecode = minute.as_timecode().am
-            assert timecode
-            decoded_minute: wwvb.WWVBMinute | None = wwvb.WWVBMinuteIERS.from_timecode_am(minute.as_timecode())
+            full_timecode = minute.as_timecode()
+            assert full_timecode.am
+            decoded_minute: wwvb.WWVBMinute | None = wwvb.WWVBMinuteIERS.from_timecode_am(full_timecode)
             assert decoded_minute
-            decoded = decoded_minute.as_timecode().am
-            self.assertEqual(
-                timecode,
-                decoded,
-                f"Checking equality of minute {minute}: [expected] {timecode} != [actual] {decoded}",
-            )
+            # The timecode is a function of the minute's fields, so comparing
+            # the minutes is at least as strict as re-encoding the decoded one
+            if minute != decoded_minute:
+                self.fail(f"Checking equality of minute {minute} != {decoded_minute}: {full_timecode}")
             dt = dt + delta
 
     def test_noise(self) -> None:
         """Test against pseudorandom noise"""
-        minute = wwvb.WWVBMinuteIERS.from_datetime(datetime.datetime(1992, 6, 30, 23, 50, tzinfo=datetime.timezone.utc))
-        r = random.Random(408)
-        junk = [
-            r.choice(
-                [
-                    wwvb.AmplitudeModulation.MARK,
-                    wwvb.AmplitudeModulation.ONE,
-                    wwvb.AmplitudeModulation.ZERO,
-                ],
-            )
-            for _ in range(480)
-        ]
+        minute = self.minute_1992
         timecode = minute.as_timecode()
-        test_input = [*junk, wwvb.AmplitudeModulation.MARK, *timecode.am]
-        decoder = decode.wwvbreceive()
-        next(decoder)
-        for code in test_input[:-1]:
-            decoded = decoder.send(code)
-            self.assertIsNone(decoded)
+        test_input = [*_NOISE_JUNK, wwvb.AmplitudeModulation.MARK, *timecode.am]
+        decoder = decode.WWVBReceiver()
+        self.assertEqual(decoder.feed_all(test_input[:-1]), [])
         decoded = decoder.send(wwvb.AmplitudeModulation.MARK)
         assert decoded
         self.assertIsNotNone(decoded)
@@ -171,43 +182,38 @@ class WWVBRoundtrip(unittest.TestCase):
 
     def test_noise2(self) -> None:
         """Test of the full minute decoder with targeted errors to get full coverage"""
-        minute = wwvb.WWVBMinuteIERS.from_datetime(datetime.datetime(2012, 6, 30, 23, 50, tzinfo=datetime.timezone.utc))
-        timecode = minute.as_timecode()
+        timecode = self.timecode_2012
         decoded = wwvb.WWVBMinute.from_timecode_am(timecode)
         self.assertIsNotNone(decoded)
+        # One working copy is corrupted and restored in place for each case
+        test_input = timecode.clone()
         for position in uwwvb.always_mark:
-            test_input = copy.deepcopy(timecode)
             for noise in (0, 1):
-                test_input.am[position] = wwvb.AmplitudeModulation(noise)
+                test_input.am[position] = _AM_BY_INT[noise]
                 decoded = wwvb.WWVBMinute.from_timecode_am(test_input)
                 self.assertIsNone(decoded)
+            test_input.am[position] = timecode.am[position]
         for position in uwwvb.always_zero:
-            test_input = copy.deepcopy(timecode)
             for noise in (1, 2):
-                test_input.am[position] = wwvb.AmplitudeModulation(noise)
+                test_input.am[position] = _AM_BY_INT[noise]
                 decoded = wwvb.WWVBMinute.from_timecode_am(test_input)
                 self.assertIsNone(decoded)
-        for i in range(8):
-            if i in (0b101, 0b010):  # Test the 6 impossible bit-combos
-                continue
-            test_input = copy.deepcopy(timecode)
-            test_input.am[36] = wwvb.AmplitudeModulation(i & 1)
-            test_input.am[37] = wwvb.AmplitudeModulation((i >> 1) & 1)
-            test_input.am[38] = wwvb.AmplitudeModulation((i >> 2) & 1)
+            test_input.am[position] = timecode.am[position]
+        for bits in _INVALID_UT1_SIGNS:
+            test_input.am[36], test_input.am[37], test_input.am[38] = bits
             decoded = wwvb.WWVBMinute.from_timecode_am(test_input)
             self.assertIsNone(decoded)
+        test_input.am[36:39] = timecode.am[36:39]
         # Invalid year-day
-        test_input = copy.deepcopy(timecode)
-        test_input.am[22] = wwvb.AmplitudeModulation(1)
-        test_input.am[23] = wwvb.AmplitudeModulation(1)
-        test_input.am[25] = wwvb.AmplitudeModulation(1)
+        test_input.am[22] = wwvb.AmplitudeModulation.ONE
+        test_input.am[23] = wwvb.AmplitudeModulation.ONE
+        test_input.am[25] = wwvb.AmplitudeModulation.ONE
         decoded = wwvb.WWVBMinute.from_timecode_am(test_input)
         self.assertIsNone(decoded)
 
     def test_noise3(self) -> None:
         """Test impossible BCD values"""
-        minute = wwvb.WWVBMinuteIERS.from_datetime(datetime.datetime(2012, 6, 30, 23, 50, tzinfo=datetime.timezone.utc))
-        timecode = minute.as_timecode()
+        timecode = self.timecode_2012
 
         for poslist in [
             [1, 2, 3, 4],  # tens minutes
@@ -220,20 +226,20 @@ class WWVBRoundtrip(unittest.TestCase):
             [50, 51, 52, 53],  # ones dut1
         ]:
             with self.subTest(test=poslist):
-                test_input = copy.deepcopy(timecode)
+                test_input = timecode.clone()
                 for pi in poslist:
-                    test_input.am[pi] = wwvb.AmplitudeModulation(1)
+                    test_input.am[pi] = wwvb.AmplitudeModulation.ONE
                 decoded = wwvb.WWVBMinute.from_timecode_am(test_input)
                 self.assertIsNone(decoded)
 
     def test_previous_next_minute(self) -> None:
         """Test that previous minute and next minute are inverses"""
-        minute = wwvb.WWVBMinuteIERS.from_datetime(datetime.datetime(1992, 6, 30, 23, 50, tzinfo=datetime.timezone.utc))
+        minute = self.minute_1992
         self.assertEqual(minute, minute.next_minute().previous_minute())
 
     def test_timecode_str(self) -> None:
         """Test the str() and repr() methods"""
-        minute = wwvb.WWVBMinuteIERS.from_datetime(datetime.datetime(1992, 6, 30, 23, 50, tzinfo=datetime.timezone.utc))
+        minute = self.minute_1992
         timecode = minute.as_timecode()
         self.assertEqual(
             str(timecode),
@@ -245,6 +251,16 @@ class WWVBRoundtrip(unittest.TestCase):
             "<WWVBTimecode 210100000200100001120001010002001000010201100100120010011112>",
         )
 
+    def test_timecode_unset_string(self) -> None:
+        """Test that unset symbols use the last character of the charset"""
+        timecode = wwvb.WWVBTimecode(3)
+        timecode.am[0] = wwvb.AmplitudeModulation.ONE
+        self.assertEqual(timecode.to_am_string(["0", "1", "2", "?"]), "1??")
+        self.assertEqual(timecode.to_pm_string(["0", "1", "?"]), "???")
+        timecode.am[1] = 3
+        with self.assertRaises(IndexError):
+            timecode.to_am_string(["0", "1", "2"])
+
     def test_extreme_dut1(self) -> None:
         """Test extreme dut1 dates"""
         s = iersdata.DUT1_DATA_START
@@ -287,6 +303,14 @@ class WWVBRoundtrip(unittest.TestCase):
             wwvb.WWVBMinuteIERS.from_datetime(d, newls=True, newut1=-300),
         )
 
+    def test_from_datetime_fold(self) -> None:
+        """Test that both readings of an ambiguous local time are distinguished"""
+        d = datetime.datetime(2021, 11, 7, 1, 30, tzinfo=tz.Mountain)
+        first = wwvb.WWVBMinute.from_datetime(d)
+        second = wwvb.WWVBMinute.from_datetime(d.replace(fold=1))
+        self.assertEqual(first.as_datetime_utc(), datetime.datetime(2021, 11, 7, 7, 30, tzinfo=datetime.timezone.utc))
+        self.assertEqual(second.as_datetime_utc(), datetime.datetime(2021, 11, 7, 8, 30, tzinfo=datetime.timezone.utc))
+
     def test_exceptions(self) -> None:
         """Test some error detection"""
         with self.assertRaises(ValueError):
@@ -324,12 +348,12 @@ class WWVBRoundtrip(unittest.TestCase):
 
         # Cuba followed year-round DST for several years
         self.assertEqual(
-            wwvb._get_dst_next(datetime.datetime(2005, 1, 1, tzinfo=datetime.timezone.utc), tz=tz.ZoneInfo("Cuba")),
+            wwvb._get_dst_next(datetime.datetime(2005, 1, 1, tzinfo=datetime.timezone.utc), tz=tz.zone("Cuba")),
             0b101111,
         )
         date, row = wwvb._get_dst_change_date_and_row(
             datetime.datetime(2005, 1, 1, tzinfo=datetime.timezone.utc),
-            tz=tz.ZoneInfo("Cuba"),
+            tz=tz.zone("Cuba"),
         )
         self.assertIsNone(date)
         self.assertIsNone(row)
@@ -338,7 +362,7 @@ class WWVBRoundtrip(unittest.TestCase):
         self.assertEqual(
             wwvb._get_dst_next(
                 datetime.datetime(1948, 1, 1, tzinfo=datetime.timezone.utc),
-                tz=tz.ZoneInfo("America/Los_Angeles"),
+                tz=tz.zone("America/Los_Angeles"),
             ),
             0b100011,
         )
@@ -347,7 +371,7 @@ class WWVBRoundtrip(unittest.TestCase):
         self.assertEqual(
             wwvb._get_dst_next(
                 datetime.datetime(1917, 1, 1, tzinfo=datetime.timezone.utc),
-                tz=tz.ZoneInfo("Europe/Berlin"),
+                tz=tz.zone("Europe/Berlin"),
             ),
             0b100011,
         )
@@ -358,7 +382,7 @@ class WWVBRoundtrip(unittest.TestCase):
         self.assertEqual(
             wwvb._get_dst_next(
                 datetime.datetime(2005, 1, 1, tzinfo=datetime.timezone.utc),
-                tz=tz.ZoneInfo("Australia/Melbourne"),
+                tz=tz.zone("Australia/Melbourne"),
             ),
             0b100011,
         )